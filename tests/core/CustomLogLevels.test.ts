@@ -1,5 +1,6 @@
 import { Logger } from '../../src';
 import { LogData } from '../../src/types';
+import { flushAsync } from '../helpers/async';
 
 describe('Custom Log Levels', () => {
   let logs: LogData[] = [];
@@ -39,7 +40,7 @@ describe('Custom Log Levels', () => {
 
     // Wait, 'debug' has priority 2 which is < 'info' priority 3
     // So only 'verbose' and 'success' should appear
-    expect(logs.length).toBe(2);
+    expect(logs).toHaveLength(2);
     expect(logs[0].level).toBe('success');
     expect(logs[1].level).toBe('verbose');
   });
@@ -60,7 +61,7 @@ describe('Custom Log Levels', () => {
     logger.logWithLevel('success', 'Success message');
 
     // Only success should appear since verbose priority (1) < success threshold (6)
-    expect(logs.length).toBe(1);
+    expect(logs).toHaveLength(1);
     expect(logs[0].level).toBe('success');
   });
 
@@ -79,7 +80,7 @@ describe('Custom Log Levels', () => {
     logger.logWithLevel('custom', 'Custom message');
     logger.error('Error message');
 
-    expect(logs.length).toBe(3);
+    expect(logs).toHaveLength(3);
     expect(logs[0].level).toBe('debug');
     expect(logs[1].level).toBe('custom');
     expect(logs[2].level).toBe('error');
@@ -121,9 +122,9 @@ describe('Custom Log Levels', () => {
 
     logger.logWithLevel('async_level', 'Async message');
     // Give time for async operation to complete
-    await new Promise(resolve => setTimeout(resolve, 10));
+    await flushAsync();
 
-    expect(logs.length).toBe(1);
+    expect(logs).toHaveLength(1);
     expect(logs[0].level).toBe('async_level');
   });
 
@@ -153,7 +154,7 @@ describe('Custom Log Levels', () => {
     childLogger.logWithLevel('parent_custom', 'Parent custom level');
     childLogger.logWithLevel('child_custom', 'Child custom level');
 
-    expect(logs.length).toBe(2);
+    expect(logs).toHaveLength(2);
     expect(logs[0].level).toBe('parent_custom');
     expect(logs[1].level).toBe('child_custom');
   });
@@ -172,7 +173,7 @@ describe('Custom Log Levels', () => {
     logger.logWithLevel('custom_info', 'Custom info message');
     logger.info('Regular info message');
 
-    expect(logs.length).toBe(2);
+    expect(logs).toHaveLength(2);
     expect(logs[0].level).toBe('custom_info');
     expect(logs[1].level).toBe('info');
   });
@@ -193,7 +194,7 @@ describe('Custom Log Levels', () => {
     logger.logWithLevel('between', 'Between message');  // Should appear
     logger.error('Error message');  // Should appear
 
-    expect(logs.length).toBe(2);
+    expect(logs).toHaveLength(2);
     expect(logs[0].level).toBe('between');
     expect(logs[1].level).toBe('error');
   });
@@ -214,7 +215,7 @@ describe('Custom Log Levels', () => {
     logger.logWithLevel('emergency', 'Emergency message');
     logger.debug('Debug message');  // Should not appear (2 < 3)
 
-    expect(logs.length).toBe(2);
+    expect(logs).toHaveLength(2);
     expect(logs[0].level).toBe('critical');
     expect(logs[1].level).toBe('emergency');
   });
@@ -233,7 +234,7 @@ describe('Custom Log Levels', () => {
     logger.logWithLevel('trace', 'Trace message');  // Should not appear (0 < 2)
     logger.debug('Debug message');  // Should appear
 
-    expect(logs.length).toBe(1);
+    expect(logs).toHaveLength(1);
     expect(logs[0].level).toBe('debug');
   });
 
@@ -251,7 +252,7 @@ describe('Custom Log Levels', () => {
     logger.logWithLevel('ultra_trace', 'Ultra trace message');  // Should not appear
     logger.info('Info message');  // Should appear
 
-    expect(logs.length).toBe(1);
+    expect(logs).toHaveLength(1);
     expect(logs[0].level).toBe('info');
   });
 
@@ -309,7 +310,7 @@ describe('Custom Log Levels', () => {
     logger.logWithLevel('notice', 'Notice message');
     logger.logWithLevel('custom', 'Custom message');
 
-    expect(logs.length).toBe(3);
+    expect(logs).toHaveLength(3);
     expect(logs[0].level).toBe('alert');
     expect(logs[1].level).toBe('notice');
     expect(logs[2].level).toBe('custom');
@@ -332,7 +333,7 @@ describe('Custom Log Levels', () => {
     logger.logWithLevel('custom_threshold', 'At threshold');  // Should appear
     logger.logWithLevel('above_threshold', 'Above');  // Should appear
 
-    expect(logs.length).toBe(2);
+    expect(logs).toHaveLength(2);
     expect(logs[0].level).toBe('custom_threshold');
     expect(logs[1].level).toBe('above_threshold');
   });
@@ -349,7 +350,7 @@ describe('Custom Log Levels', () => {
     logger.info('Info message');
     logger.error('Error message');
 
-    expect(logs.length).toBe(2);
+    expect(logs).toHaveLength(2);
     expect(logs[0].level).toBe('info');
     expect(logs[1].level).toBe('error');
   });
@@ -376,7 +377,7 @@ describe('Custom Log Levels', () => {
     logger.logWithLevel('db_query', 'DB query');
     logger.logWithLevel('http.request', 'HTTP request');
 
-    expect(logs.length).toBe(3);
+    expect(logs).toHaveLength(3);
     expect(logs[0].level).toBe('api-error');
     expect(logs[1].level).toBe('db_query');
     expect(logs[2].level).toBe('http.request');
@@ -401,9 +402,9 @@ describe('Custom Log Levels', () => {
     logger.info('Async info message');
 
     // Wait for async operations
-    await new Promise(resolve => setTimeout(resolve, 20));
+    await flushAsync();
 
-    expect(logs.length).toBe(2);
+    expect(logs).toHaveLength(2);
     expect(logs[0].level).toBe('async_custom');
     expect(logs[1].level).toBe('info');
   });
@@ -429,7 +430,7 @@ describe('Custom Log Levels', () => {
     logger.logWithLevel('low', 'Low 2');  // Now should appear
     logger.logWithLevel('high', 'High 2');  // Should still appear
 
-    expect(logs.length).toBe(2);
+    expect(logs).toHaveLength(2);
     expect(logs[0].level).toBe('low');
     expect(logs[1].level).toBe('high');
   });
@@ -450,7 +451,7 @@ describe('Custom Log Levels', () => {
       endpoint: '/api/users',
     });
 
-    expect(logs.length).toBe(1);
+    expect(logs).toHaveLength(1);
     expect(logs[0].level).toBe('metric');
     expect(logs[0].message).toBe('Performance metric');
     expect(logs[0].metadata).toEqual({
@@ -478,7 +479,7 @@ describe('Custom Log Levels', () => {
     childLogger.logWithLevel('parent_low', 'Parent low');  // Should appear
     childLogger.logWithLevel('parent_high', 'Parent high');  // Should appear
 
-    expect(logs.length).toBe(2);
+    expect(logs).toHaveLength(2);
     expect(logs[0].level).toBe('parent_low');
     expect(logs[1].level).toBe('parent_high');
   });
@@ -498,7 +499,7 @@ describe('Custom Log Levels', () => {
     logger.logWithLevel('unknown' as any, 'Unknown level message');
 
     // Should log with default high priority (999)
-    expect(logs.length).toBe(1);
+    expect(logs).toHaveLength(1);
     expect(logs[0].level).toBe('unknown');
   });
 });
\ No newline at end of file
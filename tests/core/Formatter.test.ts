@@ -10,15 +10,12 @@ import { Formatter } from '../../src/core/Formatter';
 import { LogData } from '../../src/types';
 
 describe('Formatter - Text Formatting (Refactored)', () => {
-  let formatter: Formatter;
-
-  beforeEach(() => {
-    formatter = new Formatter({
-      json: false,
-      timestamp: true,
-      timestampFormat: 'ISO',
-      colorize: false
-    });
+  // format() never mutates the instance, so one formatter serves the whole suite
+  const formatter = new Formatter({
+    json: false,
+    timestamp: true,
+    timestampFormat: 'ISO',
+    colorize: false
   });
 
   describe('Template Literal Refactoring', () => {
@@ -33,9 +30,7 @@ describe('Formatter - Text Formatting (Refactored)', () => {
 
       const output = formatter.format(logData);
       
-      expect(output).toContain('[2025-01-01T12:00:00.000Z]');
-      expect(output).toContain('[INFO]');
-      expect(output).toContain('Test message');
+      expect(output).toBe('[2025-01-01T12:00:00.000Z] [INFO] Test message');
     });
 
     test('should efficiently concatenate timestamp, level, and message', () => {
@@ -79,8 +74,7 @@ describe('Formatter - Text Formatting (Refactored)', () => {
 
       const output = formatter.format(logData);
       
-      expect(output).toContain('Error occurred');
-      expect(output).toContain('{"code":500,"userId":123}');
+      expect(output).toBe('[2025-01-01T12:00:00.000Z] [ERROR] Error occurred {"code":500,"userId":123}');
     });
 
     test('should handle all components together efficiently', () => {
@@ -114,7 +108,7 @@ describe('Formatter - Text Formatting (Refactored)', () => {
     });
 
     test('should format without timestamp using template literal', () => {
-      formatter = new Formatter({
+      const fmt = new Formatter({
         json: false,
         timestamp: false,
         colorize: false
@@ -128,7 +122,7 @@ describe('Formatter - Text Formatting (Refactored)', () => {
         metadata: undefined
       };
 
-      const output = formatter.format(logData);
+      const output = fmt.format(logData);
       
       expect(output).not.toContain('[2025');
       expect(output).toBe('[INFO] No timestamp');
@@ -174,7 +168,7 @@ describe('Formatter - Text Formatting (Refactored)', () => {
     });
 
     test('should format with colorization efficiently', () => {
-      formatter = new Formatter({
+      const fmt = new Formatter({
         json: false,
         timestamp: true,
         colorize: true
@@ -188,7 +182,7 @@ describe('Formatter - Text Formatting (Refactored)', () => {
         metadata: undefined
       };
 
-      const output = formatter.format(logData);
+      const output = fmt.format(logData);
       
       // Should still contain the message even with color codes
       expect(output).toContain('Colored error');
@@ -207,9 +201,9 @@ describe('Formatter - Text Formatting (Refactored)', () => {
 
       const output = formatter.format(logData);
       
-      expect(output).toContain('quotes');
-      expect(output).toContain('apostrophes');
-      expect(output).toContain('$pecial');
+      expect(output).toBe(
+        '[2025-01-01T12:00:00.000Z] [Special-Chars] [INFO] Message with "quotes" and \'apostrophes\' {"key":"value with $pecial ch@rs!"}'
+      );
     });
 
     test('should handle newlines in message', () => {
@@ -240,7 +234,7 @@ describe('Formatter - Text Formatting (Refactored)', () => {
       const output = formatter.format(logData);
       
       expect(output.length).toBeGreaterThan(10000);
-      expect(output).toContain(longMessage);
+      expect(output.endsWith(longMessage)).toBe(true);
     });
 
     test('should handle undefined and null metadata gracefully', () => {
@@ -281,75 +275,62 @@ describe('Formatter - Text Formatting (Refactored)', () => {
       // Empty prefix should not add extra space
       expect(output).toBe('[2025-01-01T12:00:00.000Z] [INFO] Message');
     });
-
-    test('should format consistently regardless of input order', () => {
-      const logData: LogData = {
-        level: 'info',
-        message: 'Consistent',
-        timestamp: new Date('2025-01-01T12:00:00Z'),
-        prefix: '[PREFIX]',
-        metadata: { a: 1, b: 2 }
-      };
-
-      const output1 = formatter.format(logData);
-      const output2 = formatter.format(logData);
-      
-      expect(output1).toBe(output2);
-    });
   });
 
   describe('Comparison with Previous Implementation', () => {
     test('should produce identical output to string concatenation approach', () => {
-      const testCases: LogData[] = [
-        {
-          level: 'info',
-          message: 'Simple message',
-          timestamp: new Date('2025-01-01T12:00:00Z'),
-          prefix: undefined,
-          metadata: undefined
-        },
-        {
-          level: 'warn',
-          message: 'With prefix',
-          timestamp: new Date('2025-01-01T12:00:00Z'),
-          prefix: '[APP]',
-          metadata: undefined
-        },
-        {
-          level: 'error',
-          message: 'With metadata',
-          timestamp: new Date('2025-01-01T12:00:00Z'),
-          prefix: undefined,
-          metadata: { error: 'details' }
-        },
-        {
-          level: 'debug',
-          message: 'Full example',
-          timestamp: new Date('2025-01-01T12:00:00Z'),
-          prefix: '[DEBUG]',
-          metadata: { trace: 'info', line: 42 }
-        }
+      const testCases: Array<[LogData, string]> = [
+        [
+          {
+            level: 'info',
+            message: 'Simple message',
+            timestamp: new Date('2025-01-01T12:00:00Z'),
+            prefix: undefined,
+            metadata: undefined
+          },
+          '[2025-01-01T12:00:00.000Z] [INFO] Simple message'
+        ],
+        [
+          {
+            level: 'warn',
+            message: 'With prefix',
+            timestamp: new Date('2025-01-01T12:00:00Z'),
+            prefix: '[APP]',
+            metadata: undefined
+          },
+          '[2025-01-01T12:00:00.000Z] [APP] [WARN] With prefix'
+        ],
+        [
+          {
+            level: 'error',
+            message: 'With metadata',
+            timestamp: new Date('2025-01-01T12:00:00Z'),
+            prefix: undefined,
+            metadata: { error: 'details' }
+          },
+          '[2025-01-01T12:00:00.000Z] [ERROR] With metadata {"error":"details"}'
+        ],
+        [
+          {
+            level: 'debug',
+            message: 'Full example',
+            timestamp: new Date('2025-01-01T12:00:00Z'),
+            prefix: '[DEBUG]',
+            metadata: { trace: 'info', line: 42 }
+          },
+          '[2025-01-01T12:00:00.000Z] [DEBUG] [DEBUG] Full example {"trace":"info","line":42}'
+        ]
       ];
 
-      testCases.forEach(testCase => {
-        const output = formatter.format(testCase);
-        
-        // Verify structure
-        if (testCase.prefix) {
-          expect(output).toContain(testCase.prefix);
-        }
-        if (testCase.metadata) {
-          expect(output).toContain(JSON.stringify(testCase.metadata));
-        }
-        expect(output).toContain(testCase.message);
-        expect(output).toContain(testCase.level.toUpperCase());
+      testCases.forEach(([testCase, expected]) => {
+        expect(formatter.format(testCase)).toBe(expected);
       });
     });
   });
 
   describe('Integration with Other Features', () => {
     test('should work correctly with custom colors', () => {
-      formatter = new Formatter({
+      const fmt = new Formatter({
         json: false,
         timestamp: true,
         colorize: true,
@@ -366,13 +347,13 @@ describe('Formatter - Text Formatting (Refactored)', () => {
         metadata: undefined
       };
 
-      const output = formatter.format(logData);
+      const output = fmt.format(logData);
       
       expect(output).toContain('Custom level');
     });
 
     test('should format JSON mode correctly (not affected by text refactor)', () => {
-      formatter = new Formatter({
+      const fmt = new Formatter({
         json: true,
         timestamp: true
       });
@@ -385,7 +366,7 @@ describe('Formatter - Text Formatting (Refactored)', () => {
         metadata: { key: 'value' }
       };
 
-      const output = formatter.format(logData);
+      const output = fmt.format(logData);
       const parsed = JSON.parse(output);
       
       expect(parsed.level).toBe('info');
@@ -394,68 +375,83 @@ describe('Formatter - Text Formatting (Refactored)', () => {
       expect(parsed.key).toBe('value');
     });
 
-    test('should handle different timestamp formats', () => {
-      const formats = ['ISO', 'UTC', 'LOCAL'] as const;
-      
-      formats.forEach(format => {
-        const fmt = new Formatter({
-          json: false,
-          timestamp: true,
-          timestampFormat: format,
-          colorize: false
-        });
-
-        const logData: LogData = {
-          level: 'info',
-          message: 'Test',
-          timestamp: new Date('2025-01-01T12:00:00Z'),
-          prefix: undefined,
-          metadata: undefined
-        };
+    const formatDate = new Date('2025-01-01T12:00:00Z');
 
-        const output = fmt.format(logData);
-        
-        expect(output).toContain('[INFO]');
-        expect(output).toContain('Test');
+    // LOCAL depends on the runner's locale and timezone, so derive it from the same date
+    test.each([
+      ['ISO', '[2025-01-01T12:00:00.000Z] [INFO] Test'],
+      ['UTC', '[Wed, 01 Jan 2025 12:00:00 GMT] [INFO] Test'],
+      ['LOCAL', `[${formatDate.toLocaleString()}] [INFO] Test`]
+    ])('should handle %s timestamp format', (format, expected) => {
+      const fmt = new Formatter({
+        json: false,
+        timestamp: true,
+        timestampFormat: format,
+        colorize: false
       });
-    });
-  });
 
-  describe('Memory and String Handling', () => {
-    test('should not create unnecessary intermediate strings', () => {
-      // Test that template literal approach is efficient
       const logData: LogData = {
         level: 'info',
         message: 'Test',
-        timestamp: new Date(),
-        prefix: '[PREFIX]',
-        metadata: { data: 'value' }
+        timestamp: formatDate,
+        prefix: undefined,
+        metadata: undefined
       };
 
-      // Format multiple times - should not accumulate memory
-      for (let i = 0; i < 1000; i++) {
-        formatter.format(logData);
-      }
-
-      // If this completes without memory issues, template literals are working efficiently
-      expect(true).toBe(true);
+      expect(fmt.format(logData)).toBe(expected);
     });
+  });
 
-    test('should handle concurrent formatting calls', () => {
-      const logData: LogData = {
-        level: 'info',
-        message: 'Concurrent test',
-        timestamp: new Date(),
-        prefix: undefined,
-        metadata: undefined
-      };
+  describe('Determinism', () => {
+    const cases: Array<{ name: string; logData: LogData }> = [
+      {
+        name: 'prefix and metadata',
+        logData: {
+          level: 'info',
+          message: 'Consistent',
+          timestamp: new Date('2025-01-01T12:00:00Z'),
+          prefix: '[PREFIX]',
+          metadata: { a: 1, b: 2 }
+        }
+      },
+      {
+        name: 'empty message',
+        logData: {
+          level: 'warn',
+          message: '',
+          timestamp: new Date('2025-01-01T12:00:00Z'),
+          prefix: undefined,
+          metadata: undefined
+        }
+      },
+      {
+        name: 'multiline message with nested metadata',
+        logData: {
+          level: 'error',
+          message: 'Line 1\nLine 2 with "quotes"',
+          timestamp: new Date('2025-01-01T12:00:00Z'),
+          prefix: '',
+          metadata: { nested: { key: 'value' } }
+        }
+      },
+      {
+        name: 'custom level with empty metadata',
+        logData: {
+          level: 'custom',
+          message: 'Custom level',
+          timestamp: new Date('2025-01-01T12:00:00Z'),
+          prefix: '[APP]',
+          metadata: {}
+        }
+      }
+    ];
 
-      const results = Array.from({ length: 100 }, () => 
-        formatter.format(logData)
-      );
+    test.each(cases)('should format $name identically on repeated calls', ({ logData }) => {
+      const first = formatter.format(logData);
 
-      // All results should be identical
-      expect(new Set(results).size).toBe(1);
+      for (let i = 0; i < 100; i++) {
+        expect(formatter.format(logData)).toBe(first);
+      }
     });
   });
-});
\ No newline at end of file
+});
@@ -14,6 +14,7 @@ import { Logger } from '../../src/core/Logger';
 import { LogData } from '../../src/types';
 import { Formatter } from '../../src/core/Formatter';
 import { Transport } from '../../src/transports/Transport';
+import { flushAsync } from '../helpers/async';
 
 // Mock transport for testing
 class MockTransport implements Transport {
@@ -41,6 +42,9 @@ class MockTransport implements Transport {
   }
 }
 
+// Shared rejection value, so the test can check the logger forwards this exact object
+const ASYNC_ERROR = new Error('Async error');
+
 describe('Logger - Performance Optimizations', () => {
   let mockTransport: MockTransport;
   let logger: Logger;
@@ -63,7 +67,7 @@ describe('Logger - Performance Optimizations', () => {
       logger.debug('This should not create a timestamp');
 
       // Verify no logs were written
-      expect(mockTransport.logs.length).toBe(0);
+      expect(mockTransport.logs).toHaveLength(0);
 
       // Clean up spy
       dateConstructorSpy.mockRestore();
@@ -79,7 +83,7 @@ describe('Logger - Performance Optimizations', () => {
       logger.info('This should create a timestamp');
 
       // Verify log was written with timestamp
-      expect(mockTransport.logs.length).toBe(1);
+      expect(mockTransport.logs).toHaveLength(1);
       expect(mockTransport.logs[0].timestamp).toBeInstanceOf(Date);
     });
 
@@ -98,7 +102,7 @@ describe('Logger - Performance Optimizations', () => {
       logger.info('Filtered log', expensiveMetadata);
 
       // No logs should be written
-      expect(mockTransport.logs.length).toBe(0);
+      expect(mockTransport.logs).toHaveLength(0);
     });
 
     test('should merge context only for logs that pass filter', () => {
@@ -110,11 +114,11 @@ describe('Logger - Performance Optimizations', () => {
 
       // Filtered out - context merge should not happen
       logger.debug('Debug message', { localKey: 'localValue' });
-      expect(mockTransport.logs.length).toBe(0);
+      expect(mockTransport.logs).toHaveLength(0);
 
       // Passes filter - context should be merged
       logger.warn('Warning message', { localKey: 'localValue' });
-      expect(mockTransport.logs.length).toBe(1);
+      expect(mockTransport.logs).toHaveLength(1);
       expect(mockTransport.logs[0].metadata).toEqual({
         globalKey: 'globalValue',
         localKey: 'localValue'
@@ -147,16 +151,18 @@ describe('Logger - Performance Optimizations', () => {
       logger.info('Async message');
 
       // Wait for async operation to complete
-      await new Promise(resolve => setTimeout(resolve, 10));
+      await flushAsync();
 
       // Should use asynchronous write
       expect(mockTransport.writeAsyncCallCount).toBe(1);
+      expect(mockTransport.writeCallCount).toBe(0);
+      expect(mockTransport.asyncLogs[0].message).toBe('Async message');
     });
 
     test('should handle async errors gracefully', async () => {
       const errorTransport = {
         write: jest.fn(),
-        writeAsync: jest.fn().mockRejectedValue(new Error('Async error'))
+        writeAsync: jest.fn().mockRejectedValue(ASYNC_ERROR)
       };
 
       logger = new Logger({
@@ -169,12 +175,13 @@ describe('Logger - Performance Optimizations', () => {
       const consoleErrorSpy = jest.spyOn(console, 'error').mockImplementation();
       logger.info('Message that will fail async');
 
-      await new Promise(resolve => setTimeout(resolve, 10));
+      await flushAsync();
 
       expect(consoleErrorSpy).toHaveBeenCalledWith(
         'Error during async logging:',
-        expect.any(Error)
+        expect.anything()
       );
+      expect(consoleErrorSpy.mock.calls[0]![1]).toBe(ASYNC_ERROR);
 
       consoleErrorSpy.mockRestore();
     });
@@ -193,7 +200,7 @@ describe('Logger - Performance Optimizations', () => {
 
       logger.info('Message for sync-only transport');
 
-      await new Promise(resolve => setTimeout(resolve, 10));
+      await flushAsync();
 
       // Should use setImmediate with sync write
       expect(syncOnlyTransport.write).toHaveBeenCalled();
@@ -210,7 +217,7 @@ describe('Logger - Performance Optimizations', () => {
       logger.logWithLevel('silent', 'This should never appear');
 
       // Silent logs should never be written
-      expect(mockTransport.logs.length).toBe(0);
+      expect(mockTransport.logs).toHaveLength(0);
       expect(mockTransport.writeCallCount).toBe(0);
     });
 
@@ -224,7 +231,7 @@ describe('Logger - Performance Optimizations', () => {
       // Even with metadata, should not process
       logger.logWithLevel('silent', 'Silent message', { expensive: 'metadata' });
 
-      expect(mockTransport.logs.length).toBe(0);
+      expect(mockTransport.logs).toHaveLength(0);
     });
   });
 
@@ -242,7 +249,7 @@ describe('Logger - Performance Optimizations', () => {
 
       // No logs should be written
       expect(mockTransport.writeCallCount).toBe(0);
-      expect(mockTransport.logs.length).toBe(0);
+      expect(mockTransport.logs).toHaveLength(0);
     });
 
     test('should not call transport write when filtered', () => {
@@ -276,7 +283,7 @@ describe('Logger - Performance Optimizations', () => {
       logger.warn('Passed 1');
       logger.error('Passed 2');
 
-      expect(mockTransport.logs.length).toBe(2);
+      expect(mockTransport.logs).toHaveLength(2);
       expect(mockTransport.logs[0].message).toBe('Passed 1');
       expect(mockTransport.logs[1].message).toBe('Passed 2');
     });
@@ -299,7 +306,7 @@ describe('Logger - Performance Optimizations', () => {
 
       const duration = Date.now() - startTime;
 
-      expect(mockTransport.logs.length).toBe(iterations);
+      expect(mockTransport.logs).toHaveLength(iterations);
       // Should complete quickly - adjust threshold as needed
       expect(duration).toBeLessThan(1000);
     });
@@ -315,15 +322,15 @@ describe('Logger - Performance Optimizations', () => {
 
       for (let i = 0; i < iterations; i++) {
         // These should all be filtered quickly
-        logger.debug(`Debug ${i}`);
-        logger.info(`Info ${i}`);
-        logger.warn(`Warn ${i}`);
+        logger.debug('Debug');
+        logger.info('Info');
+        logger.warn('Warn');
       }
 
       const duration = Date.now() - startTime;
 
       // No logs should be written
-      expect(mockTransport.logs.length).toBe(0);
+      expect(mockTransport.logs).toHaveLength(0);
       // Filtering should be very fast
       expect(duration).toBeLessThan(500);
     });
@@ -331,40 +338,23 @@ describe('Logger - Performance Optimizations', () => {
     test('should handle mixed sync/async logging', async () => {
       logger = new Logger({
         level: 'info',
-        asyncMode: true,
+        asyncMode: false,
         transports: [mockTransport]
       });
 
-      const syncLogs = 100;
-      const asyncLogs = 100;
-
-      // Log synchronously
-      for (let i = 0; i < syncLogs; i++) {
-        logger.info(`Sync ${i}`);
-      }
+      logger.info('Sync message');
+      logger.setAsyncMode(true);
+      logger.info('Async message');
 
       // Wait for async completion
-      await new Promise(resolve => setTimeout(resolve, 100));
+      await flushAsync();
 
-      expect(mockTransport.asyncLogs.length).toBe(syncLogs);
+      expect(mockTransport.logs.map(log => log.message)).toEqual(['Sync message']);
+      expect(mockTransport.asyncLogs.map(log => log.message)).toEqual(['Async message']);
     });
   });
 
   describe('LogAsyncDirect Method', () => {
-    test('should call logAsyncDirect when in async mode', async () => {
-      logger = new Logger({
-        level: 'info',
-        asyncMode: true,
-        transports: [mockTransport]
-      });
-
-      logger.info('Async message');
-      await new Promise(resolve => setTimeout(resolve, 10));
-
-      expect(mockTransport.asyncLogs.length).toBe(1);
-      expect(mockTransport.asyncLogs[0].message).toBe('Async message');
-    });
-
     test('should create timestamp in logAsyncDirect after filter check', async () => {
       logger = new Logger({
         level: 'warn',
@@ -378,9 +368,9 @@ describe('Logger - Performance Optimizations', () => {
       // This should create timestamp
       logger.warn('Passed message');
 
-      await new Promise(resolve => setTimeout(resolve, 10));
+      await flushAsync();
 
-      expect(mockTransport.asyncLogs.length).toBe(1);
+      expect(mockTransport.asyncLogs).toHaveLength(1);
       expect(mockTransport.asyncLogs[0].timestamp).toBeInstanceOf(Date);
     });
 
@@ -393,7 +383,7 @@ describe('Logger - Performance Optimizations', () => {
       });
 
       logger.info('Message', { local: 'metadata' });
-      await new Promise(resolve => setTimeout(resolve, 10));
+      await flushAsync();
 
       expect(mockTransport.asyncLogs[0].metadata).toEqual({
         global: 'context',
@@ -411,7 +401,7 @@ describe('Logger - Performance Optimizations', () => {
 
       logger.info('Test message');
 
-      expect(mockTransport.logs.length).toBe(1);
+      expect(mockTransport.logs).toHaveLength(1);
       expect(mockTransport.logs[0].level).toBe('info');
       expect(mockTransport.logs[0].message).toBe('Test message');
     });
@@ -451,7 +441,7 @@ describe('Logger - Performance Optimizations', () => {
 
       logger.logWithLevel('custom', 'Custom message');
 
-      expect(mockTransport.logs.length).toBe(1);
+      expect(mockTransport.logs).toHaveLength(1);
       expect(mockTransport.logs[0].level).toBe('custom');
     });
 
@@ -462,11 +452,11 @@ describe('Logger - Performance Optimizations', () => {
       });
 
       logger.debug('Should not appear');
-      expect(mockTransport.logs.length).toBe(0);
+      expect(mockTransport.logs).toHaveLength(0);
 
       logger.setLevel('debug');
       logger.debug('Should appear');
-      expect(mockTransport.logs.length).toBe(1);
+      expect(mockTransport.logs).toHaveLength(1);
     });
   });
 
@@ -504,7 +494,7 @@ describe('Logger - Performance Optimizations', () => {
       });
 
       logger.info('Message');
-      await new Promise(resolve => setTimeout(resolve, 10));
+      await flushAsync();
 
       expect(transport1.writeAsyncCallCount).toBe(1);
       expect(transport2.writeAsyncCallCount).toBe(1);
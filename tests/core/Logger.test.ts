@@ -1,5 +1,4 @@
 import { Logger } from "../../src/core/Logger";
-import { LogLevel } from "../../src/core/LogLevel";
 import { Transport } from "../../src/transports/Transport";
 import { Formatter } from "../../src/core/Formatter";
 import { LogData } from "../../src/types";
@@ -56,7 +55,7 @@ describe("Logger - Child Loggers", () => {
 
     childLogger.info("Test message", { logSpecific: "data" });
 
-    expect(mockTransport.logs.length).toBe(1);
+    expect(mockTransport.logs).toHaveLength(1);
     const logData = mockTransport.logs[0]!;
 
     expect(logData.metadata).toEqual({
@@ -74,7 +73,7 @@ describe("Logger - Child Loggers", () => {
 
     childLogger.info("Child message");
 
-    expect(mockTransport.logs.length).toBe(1);
+    expect(mockTransport.logs).toHaveLength(1);
     expect(mockTransport.logs[0]!.message).toBe("Child message");
     expect(mockTransport.logs[0]!.prefix).toBe("CHILD"); // Child's prefix should be used
   });
@@ -91,7 +90,7 @@ describe("Logger - Child Loggers", () => {
 
     grandchildLogger.warn("Grandchild message", { specific: "value" });
 
-    expect(mockTransport.logs.length).toBe(1);
+    expect(mockTransport.logs).toHaveLength(1);
     const logData = mockTransport.logs[0]!;
 
     expect(logData.level).toBe("warn");
@@ -110,7 +109,7 @@ describe("Logger - Child Loggers", () => {
     const childLogger = parentLogger.createChild();
     childLogger.info("Message from child without own context");
 
-    expect(mockTransport.logs.length).toBe(1);
+    expect(mockTransport.logs).toHaveLength(1);
     const logData = mockTransport.logs[0]!;
     expect(logData.metadata).toEqual({ parentId: 123 });
   });
@@ -119,7 +118,7 @@ describe("Logger - Child Loggers", () => {
     const childLogger = parentLogger.createChild({ context: {} });
     childLogger.info("Message from child with empty context");
 
-    expect(mockTransport.logs.length).toBe(1);
+    expect(mockTransport.logs).toHaveLength(1);
     const logData = mockTransport.logs[0]!;
     expect(logData.metadata).toEqual({ parentId: 123 });
   });
@@ -48,7 +48,7 @@ describe("README.md - Custom Levels & Colors Examples", () => {
       );
 
       // Verify 2 logs were created (verbose won't appear because its priority 1 is < info's priority 3)
-      expect(logs.length).toBe(2);
+      expect(logs).toHaveLength(2);
       expect(logs[0].level).toBe("success");
       expect(logs[0].message).toBe("This is a success message in green!");
       expect(logs[1].level).toBe("critical");
@@ -70,7 +70,7 @@ describe("README.md - Custom Levels & Colors Examples", () => {
       logger.logWithLevel("success", "Should appear"); // priority 6 > 3
       logger.logWithLevel("critical", "Should appear"); // priority 7 > 3
 
-      expect(logs.length).toBe(2);
+      expect(logs).toHaveLength(2);
       expect(logs[0].level).toBe("success");
       expect(logs[1].level).toBe("critical");
     });
@@ -95,7 +95,7 @@ describe("README.md - Custom Levels & Colors Examples", () => {
       // This WILL be shown (critical has priority 7 >= threshold 7).
       highLevelLogger.logWithLevel("critical", "This critical message appears");
 
-      expect(logs.length).toBe(1);
+      expect(logs).toHaveLength(1);
       expect(logs[0].level).toBe("critical");
       expect(logs[0].message).toBe("This critical message appears");
     });
@@ -114,7 +114,7 @@ describe("README.md - Custom Levels & Colors Examples", () => {
       highLevelLogger.logWithLevel("success", "Should not appear"); // 6 < 7
       highLevelLogger.logWithLevel("critical", "Should appear"); // 7 >= 7
 
-      expect(logs.length).toBe(1);
+      expect(logs).toHaveLength(1);
       expect(logs[0].level).toBe("critical");
     });
   });
@@ -145,7 +145,7 @@ describe("README.md - Custom Levels & Colors Examples", () => {
       childLogger.logWithLevel("parent_custom", "Inherited from parent");
       childLogger.logWithLevel("child_custom", "Defined in child");
 
-      expect(logs.length).toBe(2);
+      expect(logs).toHaveLength(2);
       expect(logs[0].level).toBe("parent_custom");
       expect(logs[0].message).toBe("Inherited from parent");
       expect(logs[1].level).toBe("child_custom");
@@ -173,7 +173,7 @@ describe("README.md - Custom Levels & Colors Examples", () => {
         childLogger.logWithLevel("child_custom", "Child level");
       }).not.toThrow();
 
-      expect(logs.length).toBe(2);
+      expect(logs).toHaveLength(2);
     });
   });
 
@@ -198,7 +198,7 @@ describe("README.md - Custom Levels & Colors Examples", () => {
       logger.logWithLevel("warning", "Warning message");
       logger.logWithLevel("alert", "Alert message");
 
-      expect(logs.length).toBe(3);
+      expect(logs).toHaveLength(3);
       expect(logs.map((l) => l.level)).toEqual(["success", "warning", "alert"]);
     });
 
@@ -218,7 +218,7 @@ describe("README.md - Custom Levels & Colors Examples", () => {
         logger.logWithLevel("custom2", "Message 2");
       }).not.toThrow();
 
-      expect(logs.length).toBe(2);
+      expect(logs).toHaveLength(2);
     });
   });
 
@@ -235,7 +235,7 @@ describe("README.md - Custom Levels & Colors Examples", () => {
       logger.info("Built-in info");
       logger.logWithLevel("custom_info", "Custom info level");
 
-      expect(logs.length).toBe(2);
+      expect(logs).toHaveLength(2);
     });
 
     test("should handle fractional priorities", () => {
@@ -249,7 +249,7 @@ describe("README.md - Custom Levels & Colors Examples", () => {
 
       logger.logWithLevel("between_info_warn", "Between message");
 
-      expect(logs.length).toBe(1);
+      expect(logs).toHaveLength(1);
       expect(logs[0].level).toBe("between_info_warn");
     });
 
@@ -266,7 +266,7 @@ describe("README.md - Custom Levels & Colors Examples", () => {
       logger.logWithLevel("critical", "Critical message");
       logger.logWithLevel("ultra_critical", "Ultra critical message");
 
-      expect(logs.length).toBe(2);
+      expect(logs).toHaveLength(2);
     });
 
     test("should handle negative priority custom levels", () => {
@@ -283,7 +283,7 @@ describe("README.md - Custom Levels & Colors Examples", () => {
       logger.logWithLevel("ultra_verbose", "Should not appear"); // -10 < 3
       logger.info("Should appear"); // 3 >= 3
 
-      expect(logs.length).toBe(1);
+      expect(logs).toHaveLength(1);
       expect(logs[0].level).toBe("info");
     });
   });
@@ -0,0 +1,7 @@
+/**
+ * Shared async helpers for the test suite
+ */
+
+// Resolves after one setImmediate turn, by which point work the logger or a
+// transport queued with setImmediate (and any promise chains it started) has run
+export const flushAsync = () => new Promise(resolve => setImmediate(resolve));
@@ -1,5 +1,6 @@
 import { FileTransport } from '../../src/transports/FileTransport';
-import { Formatter } from '../../src/core/Formatter'; import { LogData } from '../../src/types';
+import { Formatter } from '../../src/core/Formatter';
+import { LogData } from '../../src/types';
 import * as fs from 'fs';
 import * as path from 'path';
 import * as os from 'os';
@@ -17,14 +18,9 @@ describe('FileTransport Timestamp Extraction Reproduction', () => {
     });
 
     afterEach(() => {
-        if (fs.existsSync(testDir)) {
-            try {
-                fs.rmSync(testDir, { recursive: true });
-            } catch (error) {
-                // Ignore cleanup errors
-            }
-        }
+        fs.rmSync(testDir, { recursive: true, force: true });
     });
+
     const createLogData = (message: string): LogData => ({
         level: 'info' as any,
         message,
@@ -70,7 +66,7 @@ describe('FileTransport Timestamp Extraction Reproduction', () => {
         console.log('Remaining files:', rotatedFiles);
 
         // Expectation: Only the file with time3 should remain
-        expect(rotatedFiles.length).toBe(1);
+        expect(rotatedFiles).toHaveLength(1);
         expect(rotatedFiles[0]).toContain(time3.toString());
         expect(rotatedFiles[0]).not.toContain(time1.toString());
     });
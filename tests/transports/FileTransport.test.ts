@@ -1,4 +1,4 @@
-import { FileTransport, FileTransportOptions } from '../../src/transports/FileTransport';
+import { FileTransport } from '../../src/transports/FileTransport';
 import { Formatter } from '../../src/core/Formatter';
 import { LogData } from '../../src/types';
 import * as fs from 'fs';
@@ -8,32 +8,26 @@ import * as os from 'os';
 describe('FileTransport', () => {
   let testDir: string;
   let testFilePath: string;
-  let formatter: Formatter;
+  const formatter = new Formatter({ colorize: false, json: false, timestamp: true });
   const TEST_LOG_MESSAGE = 'Test log message';
+  const UNICODE_LOG_MESSAGE = '世界 🌍 Ñoño';
 
-  beforeEach(() => {
-    // Create a unique temporary directory for each test
-    testDir = fs.mkdtempSync(path.join(os.tmpdir(), 'filetransport-test-'));
-    testFilePath = path.join(testDir, 'test.log');
-    formatter = new Formatter({ colorize: false, json: false, timestamp: true });
+  let rootDir: string;
+
+  beforeAll(() => {
+    // Per-test directories live under this root and accumulate until afterAll,
+    // which removes the whole tree with one rmSync
+    rootDir = fs.mkdtempSync(path.join(os.tmpdir(), 'filetransport-test-'));
   });
 
-  afterEach(() => {
-    // Clean up test directory and all its contents
-    if (fs.existsSync(testDir)) {
-      try {
-        const files = fs.readdirSync(testDir);
-        files.forEach(file => {
-          const filePath = path.join(testDir, file);
-          if (fs.existsSync(filePath)) {
-            fs.unlinkSync(filePath);
-          }
-        });
-        fs.rmdirSync(testDir);
-      } catch (error) {
-        // Ignore cleanup errors
-      }
-    }
+  afterAll(() => {
+    fs.rmSync(rootDir, { recursive: true, force: true });
+  });
+
+  beforeEach(() => {
+    // Each test still gets its own directory so rotation counts stay isolated
+    testDir = fs.mkdtempSync(path.join(rootDir, 'case-'));
+    testFilePath = path.join(testDir, 'test.log');
   });
 
   // Helper function to create mock LogData
@@ -44,8 +38,12 @@ describe('FileTransport', () => {
     metadata,
   });
 
-  // Helper function to wait for async operations
-  const wait = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+  // Helper function to lay down rotated files (test.log.<suffix>) next to the active log
+  const seedRotatedFiles = (...suffixes: number[]) => {
+    suffixes.forEach((suffix, i) => {
+      fs.writeFileSync(`${testFilePath}.${suffix}`, `content${i + 1}`);
+    });
+  };
 
   describe('Constructor', () => {
     it('should create a FileTransport instance with default options', () => {
@@ -119,7 +117,7 @@ describe('FileTransport', () => {
 
       const content = fs.readFileSync(testFilePath, 'utf-8');
       const lines = content.split('\n').filter(line => line.length > 0);
-      expect(lines.length).toBe(2);
+      expect(lines).toHaveLength(2);
     });
 
     it('should write logs with different log levels', () => {
@@ -163,6 +161,14 @@ describe('FileTransport', () => {
       expect(content.length).toBeGreaterThan(0);
     });
 
+    it('should preserve unicode characters', () => {
+      const transport = new FileTransport({ path: testFilePath });
+      transport.write(createLogData(UNICODE_LOG_MESSAGE), formatter);
+
+      const content = fs.readFileSync(testFilePath, 'utf-8');
+      expect(content).toContain(UNICODE_LOG_MESSAGE);
+    });
+
     it('should handle very long messages', () => {
       const transport = new FileTransport({ path: testFilePath });
       const longMessage = 'A'.repeat(10000);
@@ -218,7 +224,7 @@ describe('FileTransport', () => {
       // Override the filePath to an invalid location after construction
       (transport as any).filePath = invalidPath;
 
-      await expect(transport.writeAsync(createLogData('Test'), formatter)).rejects.toThrow();
+      await expect(transport.writeAsync(createLogData('Test'), formatter)).rejects.toThrow(/ENOENT/);
     });
 
     it('should handle async writes with rotation', async () => {
@@ -252,7 +258,7 @@ describe('FileTransport', () => {
 
       const files = fs.readdirSync(testDir);
       const logFiles = files.filter(f => f.startsWith('test.log'));
-      expect(logFiles.length).toBe(1);
+      expect(logFiles).toHaveLength(1);
     });
 
     it('should rotate file when size exceeds maxSize', () => {
@@ -308,8 +314,6 @@ describe('FileTransport', () => {
       });
 
       await transport.writeAsync(createLogData('A'.repeat(100)), formatter);
-      // Give time for async rotation to complete
-      await wait(100);
 
       const files = fs.readdirSync(testDir);
       const logFiles = files.filter(f => f.startsWith('test.log'));
@@ -391,7 +395,7 @@ describe('FileTransport', () => {
       });
 
       // Create a legitimate rotated file
-      fs.writeFileSync(testFilePath + '.1234567890', 'content');
+      seedRotatedFiles(1234567890);
 
       // Create a malicious filename (should be filtered out)
       const maliciousFile = path.join(testDir, 'test.log../../../etc/passwd');
@@ -418,9 +422,7 @@ describe('FileTransport', () => {
       });
 
       // Create files
-      fs.writeFileSync(testFilePath + '.1111111111', 'old content 1');
-      fs.writeFileSync(testFilePath + '.2222222222', 'old content 2');
-      fs.writeFileSync(testFilePath + '.3333333333', 'old content 3');
+      seedRotatedFiles(1111111111, 2222222222, 3333333333);
 
       // Trigger cleanup by writing
       transport.write(createLogData('G'.repeat(100)), formatter);
@@ -446,7 +448,7 @@ describe('FileTransport', () => {
       }
 
       // Create legitimate file
-      fs.writeFileSync(testFilePath + '.1234567890', 'content');
+      seedRotatedFiles(1234567890);
 
       transport.write(createLogData('H'.repeat(100)), formatter);
 
@@ -462,8 +464,7 @@ describe('FileTransport', () => {
       });
 
       // Create legitimate files
-      fs.writeFileSync(testFilePath + '.1111111111', 'content1');
-      fs.writeFileSync(testFilePath + '.2222222222', 'content2');
+      seedRotatedFiles(1111111111, 2222222222);
 
       transport.write(createLogData('I'.repeat(100)), formatter);
 
@@ -480,9 +481,7 @@ describe('FileTransport', () => {
       });
 
       // Create multiple files
-      fs.writeFileSync(testFilePath + '.1000000000', 'content1');
-      fs.writeFileSync(testFilePath + '.2000000000', 'content2');
-      fs.writeFileSync(testFilePath + '.3000000000', 'content3');
+      seedRotatedFiles(1000000000, 2000000000, 3000000000);
 
       // Trigger cleanup
       transport.write(createLogData('J'.repeat(100)), formatter);
@@ -523,9 +522,6 @@ describe('FileTransport', () => {
         await transport.writeAsync(createLogData(`Async ${i}: ${'M'.repeat(100)}`), formatter);
       }
 
-      // Wait for cleanup to complete
-      await wait(200);
-
       const files = fs.readdirSync(testDir);
       const logFiles = files.filter(f => f.startsWith('test.log'));
       expect(logFiles.length).toBeLessThanOrEqual(3);
@@ -534,19 +530,11 @@ describe('FileTransport', () => {
     it('should handle readdir errors in async cleanup', async () => {
       const transport = new FileTransport({ path: testFilePath });
 
-      // Create legitimate files
-      fs.writeFileSync(testFilePath + '.1111111111', 'content1');
-      fs.writeFileSync(testFilePath + '.2222222222', 'content2');
-
-      // Override directory to non-existent location to trigger error
-      const originalFilePath = (transport as any).filePath;
+      // Point at a directory that does not exist so readdir fails; nothing on disk is consulted
       (transport as any).filePath = path.join(testDir, 'nonexistent', 'test.log');
 
       // Should NOT throw - errors are caught and logged
       await expect((transport as any).cleanupOldFilesAsync()).resolves.toBeUndefined();
-
-      // Restore
-      (transport as any).filePath = originalFilePath;
     });
 
     it('should resolve immediately when no files to delete', async () => {
@@ -570,12 +558,9 @@ describe('FileTransport', () => {
       });
 
       // Create legitimate files
-      fs.writeFileSync(testFilePath + '.1111111111', 'content1');
-      fs.writeFileSync(testFilePath + '.2222222222', 'content2');
-      fs.writeFileSync(testFilePath + '.3333333333', 'content3');
+      seedRotatedFiles(1111111111, 2222222222, 3333333333);
 
       await transport.writeAsync(createLogData('N'.repeat(100)), formatter);
-      await wait(100);
 
       const files = fs.readdirSync(testDir);
       const logFiles = files.filter(f => f.startsWith('test.log'));
@@ -589,10 +574,9 @@ describe('FileTransport', () => {
         maxFiles: 1
       });
 
-      fs.writeFileSync(testFilePath + '.1234567890', 'content');
+      seedRotatedFiles(1234567890);
 
       await transport.writeAsync(createLogData('O'.repeat(100)), formatter);
-      await wait(100);
 
       expect(fs.existsSync(testFilePath)).toBe(true);
     });
@@ -604,11 +588,9 @@ describe('FileTransport', () => {
         maxFiles: 2
       });
 
-      fs.writeFileSync(testFilePath + '.1111111111', 'content1');
-      fs.writeFileSync(testFilePath + '.2222222222', 'content2');
+      seedRotatedFiles(1111111111, 2222222222);
 
       await transport.writeAsync(createLogData('P'.repeat(100)), formatter);
-      await wait(100);
 
       const files = fs.readdirSync(testDir);
       expect(files.length).toBeGreaterThan(0);
@@ -622,12 +604,9 @@ describe('FileTransport', () => {
       });
 
       // Create files
-      fs.writeFileSync(testFilePath + '.1000000000', 'content1');
-      fs.writeFileSync(testFilePath + '.2000000000', 'content2');
-      fs.writeFileSync(testFilePath + '.3000000000', 'content3');
+      seedRotatedFiles(1000000000, 2000000000, 3000000000);
 
       await transport.writeAsync(createLogData('Q'.repeat(100)), formatter);
-      await wait(100);
 
       const files = fs.readdirSync(testDir);
       const logFiles = files.filter(f => f.startsWith('test.log'));
@@ -642,11 +621,9 @@ describe('FileTransport', () => {
         maxFiles: 2
       });
 
-      fs.writeFileSync(testFilePath + '.1111111111', 'content1');
-      fs.writeFileSync(testFilePath + '.2222222222', 'content2');
+      seedRotatedFiles(1111111111, 2222222222);
 
       await transport.writeAsync(createLogData('R'.repeat(100)), formatter);
-      await wait(100);
 
       // Should handle the edge case: resolvedPath !== resolvedDir
       const files = fs.readdirSync(testDir);
@@ -662,8 +639,7 @@ describe('FileTransport', () => {
       });
 
       // Create files
-      fs.writeFileSync(testFilePath + '.1111111111', 'content1');
-      fs.writeFileSync(testFilePath + '.2222222222', 'content2');
+      seedRotatedFiles(1111111111, 2222222222);
 
       // Make one file read-only to potentially cause unlink error
       const fileToProtect = testFilePath + '.1111111111';
@@ -676,7 +652,6 @@ describe('FileTransport', () => {
       }
 
       await transport.writeAsync(createLogData('S'.repeat(100)), formatter);
-      await wait(100);
 
       // Cleanup the protected file
       try {
@@ -699,12 +674,9 @@ describe('FileTransport', () => {
       });
 
       // Create exactly maxFiles + 1 files
-      fs.writeFileSync(testFilePath + '.1111111111', 'content1');
-      fs.writeFileSync(testFilePath + '.2222222222', 'content2');
-      fs.writeFileSync(testFilePath + '.3333333333', 'content3');
+      seedRotatedFiles(1111111111, 2222222222, 3333333333);
 
       await transport.writeAsync(createLogData('T'.repeat(100)), formatter);
-      await wait(150);
 
       const files = fs.readdirSync(testDir);
       const logFiles = files.filter(f => f.startsWith('test.log'));
@@ -735,8 +707,8 @@ describe('FileTransport', () => {
 
       expect(fs.existsSync(testFilePath)).toBe(true);
       const content = fs.readFileSync(testFilePath, 'utf-8');
-      const lines = content.split('\n').filter(line => line.length > 0);
-      expect(lines.length).toBe(100);
+      // Counts newlines, not non-empty lines: each entry must end in exactly one \n
+      expect(content.match(/\n/g)).toHaveLength(100);
     });
 
     it('should handle writes with undefined metadata', () => {
@@ -879,9 +851,7 @@ describe('FileTransport', () => {
 
       // Create files with specific timestamps to test sorting
       const now = Date.now();
-      fs.writeFileSync(testFilePath + '.' + (now - 3000), 'old1');
-      fs.writeFileSync(testFilePath + '.' + (now - 2000), 'old2');
-      fs.writeFileSync(testFilePath + '.' + (now - 1000), 'old3');
+      seedRotatedFiles(now - 3000, now - 2000, now - 1000);
 
       transport.write(createLogData('W'.repeat(100)), formatter);
 
@@ -952,7 +922,6 @@ describe('FileTransport', () => {
       }
 
       await Promise.all(writes);
-      await wait(200);
 
       const files = fs.readdirSync(testDir);
       const logFiles = files.filter(f => f.startsWith('test.log'));
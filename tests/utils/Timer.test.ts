@@ -11,8 +11,19 @@
 
 import { Logger } from '../../src/core/Logger';
 import { Timer } from '../../src/utils/Timerutil';
+import { flushAsync } from '../helpers/async';
+
+// Moves Date.now() forward by `ms`; the spy is restored after each test
+const advanceClock = (ms: number) => {
+  const mockTime = Date.now() + ms;
+  jest.spyOn(Date, 'now').mockReturnValue(mockTime);
+};
 
 describe('Timer Utility', () => {
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
   describe('Timer Class', () => {
     let logMessages: string[];
     let logFn: (message: string) => void;
@@ -39,9 +50,7 @@ describe('Timer Utility', () => {
       const startTime = (timer as any).startTime;
 
       // Mock Date.now to simulate passage of time
-      const originalDateNow = Date.now;
-      const mockTime = Date.now() + 100; // 100ms later
-      Date.now = jest.fn(() => mockTime);
+      advanceClock(100);
 
       timer.end();
 
@@ -49,18 +58,13 @@ describe('Timer Utility', () => {
       expect(logMessages[0]).toMatch(/test-timer took \d+ms/);
       const duration = parseInt(logMessages[0].match(/\d+/)![0]);
       expect(duration).toBeGreaterThanOrEqual(100); // At least 100ms passed
-
-      // Restore original Date.now
-      Date.now = originalDateNow;
     });
 
     test('end() is idempotent', () => {
       const timer = new Timer('test-timer', logFn);
 
       // Mock Date.now to ensure consistent timing
-      const originalDateNow = Date.now;
-      const mockTime = Date.now() + 50;
-      Date.now = jest.fn(() => mockTime);
+      advanceClock(50);
 
       // Call end() multiple times
       timer.end();
@@ -70,18 +74,13 @@ describe('Timer Utility', () => {
       // Should only log once despite multiple calls
       expect(logMessages).toHaveLength(1);
       expect(logMessages[0]).toBe('test-timer took 50ms');
-
-      // Restore original Date.now
-      Date.now = originalDateNow;
     });
 
     test('end() should not bypass validation or handling', () => {
       const timer = new Timer('validation-test', logFn);
 
       // Mock Date.now to simulate time passage
-      const originalDateNow = Date.now;
-      const mockTime = Date.now() + 25;
-      Date.now = jest.fn(() => mockTime);
+      advanceClock(25);
 
       timer.end();
 
@@ -89,18 +88,13 @@ describe('Timer Utility', () => {
       expect(logMessages).toHaveLength(1);
       const message = logMessages[0];
       expect(message).toMatch(/validation-test took \d+ms/);
-
-      // Restore original Date.now
-      Date.now = originalDateNow;
     });
 
     test('timer works with different names', () => {
       const timer1 = new Timer('timer-one', logFn);
       const timer2 = new Timer('timer-two', logFn);
 
-      const originalDateNow = Date.now;
-      const mockTime = Date.now() + 75;
-      Date.now = jest.fn(() => mockTime);
+      advanceClock(75);
 
       timer1.end();
       timer2.end();
@@ -108,9 +102,6 @@ describe('Timer Utility', () => {
       expect(logMessages).toHaveLength(2);
       expect(logMessages[0]).toBe('timer-one took 75ms');
       expect(logMessages[1]).toBe('timer-two took 75ms');
-
-      // Restore original Date.now
-      Date.now = originalDateNow;
     });
   });
 
@@ -125,18 +116,13 @@ describe('Timer Utility', () => {
       const timer = logger.startTimer('my-timer');
 
       // Mock Date.now for consistent timing
-      const originalDateNow = Date.now;
-      const mockTime = Date.now() + 100;
-      Date.now = jest.fn(() => mockTime);
+      advanceClock(100);
 
       // End the timer
       timer.end();
 
       // Verify that logger.info was called with the correct message
       expect(infoSpy).toHaveBeenCalledWith('my-timer took 100ms');
-
-      // Restore original Date.now
-      Date.now = originalDateNow;
     });
 
     test('Logger.startTimer timer lifecycle/ownership expectations', () => {
@@ -147,9 +133,7 @@ describe('Timer Utility', () => {
       const timer = logger.startTimer('lifecycle-test');
 
       // Verify timer can be ended
-      const originalDateNow = Date.now;
-      const mockTime = Date.now() + 50;
-      Date.now = jest.fn(() => mockTime);
+      advanceClock(50);
 
       timer.end();
 
@@ -160,9 +144,6 @@ describe('Timer Utility', () => {
       // Try to end again - should still only have logged once due to idempotency
       timer.end();
       expect(infoSpy).toHaveBeenCalledTimes(1);
-
-      // Restore original Date.now
-      Date.now = originalDateNow;
     });
 
     test('startTimer works with different logger configurations', () => {
@@ -176,16 +157,11 @@ describe('Timer Utility', () => {
 
       const timer = logger.startTimer('config-test');
 
-      const originalDateNow = Date.now;
-      const mockTime = Date.now() + 125;
-      Date.now = jest.fn(() => mockTime);
+      advanceClock(125);
 
       timer.end();
 
       expect(infoSpy).toHaveBeenCalledWith('config-test took 125ms');
-
-      // Restore original Date.now
-      Date.now = originalDateNow;
     });
   });
 
@@ -230,9 +206,7 @@ describe('Timer Utility', () => {
 
       const timer = logger.startTimer('integration-test');
 
-      const originalDateNow = Date.now;
-      const mockTime = Date.now() + 80;
-      Date.now = jest.fn(() => mockTime);
+      advanceClock(80);
 
       timer.end();
 
@@ -242,9 +216,6 @@ describe('Timer Utility', () => {
       const logMessage = infoSpy.mock.calls[0][0];
       expect(logMessage).toContain('integration-test took 80ms');
       expect(logMessage).toContain('[INFO]'); // Expecting bracketed level format
-
-      // Restore original Date.now
-      Date.now = originalDateNow;
     });
 
     test('Timer with async logger', async () => {
@@ -267,22 +238,17 @@ describe('Timer Utility', () => {
 
       const timer = logger.startTimer('async-test');
 
-      const originalDateNow = Date.now;
-      const mockTime = Date.now() + 60;
-      Date.now = jest.fn(() => mockTime);
+      advanceClock(60);
 
       timer.end();
 
       // Wait briefly to allow async logging to complete
-      await new Promise(resolve => setTimeout(resolve, 10));
+      await flushAsync();
 
       expect(infoSpy).toHaveBeenCalledTimes(1);
       const logMessage = infoSpy.mock.calls[0][0];
       expect(logMessage).toContain('async-test took 60ms');
       expect(logMessage).toContain('[INFO]');
-
-      // Restore original Date.now
-      Date.now = originalDateNow;
     });
   });
 });
\ No newline at end of file